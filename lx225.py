@@ -1,5 +1,8 @@
 from typing import Union
 from math import pi
+from contextlib import contextmanager
+import os
+import struct
 import serial
 
 
@@ -20,26 +23,190 @@ class ServoArgumentError(ServoError):
 class ServoLogicalError(ServoError):
     pass
 
+_HEADER = b"\x55\x55"
+_SERVO_UNITS_PER_DEGREE = 100 / 27  # 1000 servo position units per 270 degrees
+_BYTE_PACKET = struct.Struct("<BBBB")         # id, length, command, value
+_WORD_PAIR_PACKET = struct.Struct("<BBBHH")   # id, length, command, value1, value2
+_MOTOR_MODE_PACKET = struct.Struct("<BBBBBH") # id, length, command, mode, 0, speed
+_MOVE_COMMANDS = (1, 7)                       # move command for wait=False/True
+_WORD_PAIR_REPLY = struct.Struct("<HH")       # value1, value2
+_MOTOR_MODE_REPLY = struct.Struct("<Bxh")     # mode, speed
+
+# Bound write()/read() of the open controller port (set by LX225.initialize())
+_write = None
+_read = None
+_fd = None
+
+# Writes straight to the port file descriptor skipping pyserial's write()
+# wrapper, leaves whatever does not fit in the OS buffer to pyserial
+def _fd_write(data: bytes) -> None:
+    try:
+        written = os.write(_fd, data)
+    except BlockingIOError:
+        written = 0
+    if written < len(data):
+        LX225._controller.write(data[written:])
+
 class LX225:
+    __slots__ = (
+        "_id",
+        "_frames",
+        "_commanded_angle",
+        "_waiting_angle",
+        "_waiting_for_move",
+        "_angle_offset",
+        "_angle_limits",
+        "_vin_limits",
+        "_temp_limit",
+        "_motor_mode",
+        "_motor_speed",
+        "_torque_enabled",
+        "_led_powered",
+        "_led_error_triggers",
+    )
+
     _controller = None
+    _tx_buffer: list[bytes] = None  # frames queued while batching (None if not batching)
+    _batch_depth = 0                # nested begin_batch() calls, flushed by the outermost end_batch()
+    _move_frame = bytearray(_HEADER + bytes(_WORD_PAIR_PACKET.size + 1))  # move() builds its frame here
+    _move_view = memoryview(_move_frame)
+
+    # Servo configuration kept by get_state() and restored from "cached_state"
+    _CACHED_STATE = (
+        "_angle_offset",
+        "_angle_limits",
+        "_vin_limits",
+        "_temp_limit",
+        "_motor_mode",
+        "_motor_speed",
+        "_torque_enabled",
+        "_led_powered",
+        "_led_error_triggers",
+    )
+
+    # Fixed (argument-less) packets, pre-framed per servo ID in _build_frames()
+    _FIXED_PACKETS = {
+        "move_start": (3, 11),
+        "move_stop": (3, 12),
+        "save_angle_offset": (3, 18),
+        "servo_mode": (7, 29, 0, 0, 0, 0),
+        "enable_torque": (4, 31, 0),
+        "disable_torque": (4, 31, 1),
+        "get_last_instant_move": (3, 2),
+        "get_last_delayed_move": (3, 8),
+        "get_id": (3, 14),
+        "get_angle_offset": (3, 19),
+        "get_angle_limits": (3, 21),
+        "get_vin_limits": (3, 23),
+        "get_temp_limit": (3, 25),
+        "get_motor_mode": (3, 30),
+        "get_torque_state": (3, 32),
+        "get_led_power": (3, 34),
+        "get_led_error_triggers": (3, 36),
+        "get_temp": (3, 26),
+        "get_vin": (3, 27),
+        "get_physical_angle": (3, 28),
+    }
 
     @staticmethod
-    def initialize(port: str, timeout: float = 0.02) -> None:
-        if LX225._controller is not None:
-            LX225._controller.reset_input_buffer()
-            LX225._controller.reset_output_buffer()
-            LX225._controller.close()
+    def initialize(port: str, timeout: float = 0.02, low_latency: bool = True) -> None:
+        global _write, _read, _fd
 
+        LX225.close()
         LX225._controller = serial.Serial(
             port=port, baudrate=115200, timeout=timeout, write_timeout=timeout
         )
+        _write = LX225._controller.write
+        _read = LX225._controller.read
+
+        # POSIX ports can be written directly (there is no fd on Windows)
+        try:
+            _fd = LX225._controller.fileno()
+            _write = _fd_write
+        except (AttributeError, OSError):
+            _fd = None
+
+        # Ask the USB-serial driver not to hold back the replies (on Linux
+        # ftdi_sio drops its 16ms latency timer to 1ms), ignore if unsupported
+        if low_latency:
+            try:
+                LX225._controller.set_low_latency_mode(True)
+            except (AttributeError, ValueError, OSError, NotImplementedError):
+                pass
 
     @staticmethod
     def close() -> None:
+        global _write, _read, _fd
+
         if LX225._controller is not None:
-            LX225._controller.reset_input_buffer()
-            LX225._controller.reset_output_buffer()
             LX225._controller.close()
+            LX225._controller = None
+        _write = None
+        _read = None
+        _fd = None
+
+    @staticmethod
+    def send_bulk(frames: list[bytes]) -> None:
+        _write(b"".join(frames))
+
+    @staticmethod
+    def begin_batch() -> None:
+        if LX225._batch_depth == 0:
+            LX225._tx_buffer = []
+        LX225._batch_depth += 1
+
+    @staticmethod
+    def end_batch() -> None:
+        if LX225._batch_depth == 0:
+            return
+        LX225._batch_depth -= 1
+        if LX225._batch_depth:
+            return
+        frames = LX225._tx_buffer
+        LX225._tx_buffer = None
+        if frames:
+            LX225.send_bulk(frames)
+
+    # Queue all the packets sent inside the "with" block and write them
+    # to the bus at once when the block exits (nested blocks are merged
+    # into the outermost one)
+    @staticmethod
+    @contextmanager
+    def batch():
+        LX225.begin_batch()
+        try:
+            yield
+        finally:
+            LX225.end_batch()
+
+    # Move several servos with a single bus write
+    # moves : list of (servo, angle, time) tuples
+    @staticmethod
+    def move_many(moves: list[tuple["LX225", float, int]]) -> None:
+        with LX225.batch():
+            for servo, angle, time in moves:
+                servo.move(angle, time)
+
+    # Read the physical angles of several servos. The bus is half-duplex, so
+    # each request is sent only after the previous reply has been read, then
+    # all the replies are decoded at once.
+    # Returns {servo ID: angle}
+    @staticmethod
+    def poll_physical_angles(servos: list["LX225"]) -> dict[int, float]:
+        payloads = bytearray()
+        for servo in servos:
+            LX225._send_frame(servo._frames["get_physical_angle"])
+            payloads += LX225._read_packet(2, servo._id)
+
+        angles = struct.unpack(f"<{len(servos)}h", payloads)
+        return {
+            servo._id: LX225._from_servo_range(angle)
+            for servo, angle in zip(servos, angles)
+        }
+
+    @staticmethod
+    def reset_input_buffer() -> None:
+        LX225._controller.reset_input_buffer()
 
     @staticmethod
     def set_timeout(seconds: float) -> None:
@@ -50,16 +217,33 @@ class LX225:
     def get_timeout() -> float:
         return LX225._controller.timeout
 
-    def __init__(self, id_: int, disable_torque: bool = False) -> None:
+    # cached_state : servo configuration returned by get_state() of an earlier
+    #                object for the same servo, skips polling it from the hardware
+    def __init__(
+        self, id_: int, disable_torque: bool = False, cached_state: dict = None
+    ) -> None:
         if id_ < 0 or id_ > 253:
             raise ServoArgumentError(
                 "Servo ID must be between 0 and 253 inclusive", id_
             )
 
         self._id = id_
+        self._build_frames()
         self._commanded_angle = LX225._to_servo_range(self.get_physical_angle())
         self._waiting_angle = self._commanded_angle
         self._waiting_for_move = False
+        if cached_state is None:
+            self._refresh_all_state()
+        else:
+            for name in LX225._CACHED_STATE:
+                setattr(self, name, cached_state[name])
+
+        if disable_torque:
+            self.disable_torque()
+        else:
+            self.enable_torque()
+
+    def _refresh_all_state(self) -> None:
         self._angle_offset = LX225._to_servo_range(
             self.get_angle_offset(poll_hardware=True)
         )
@@ -68,62 +252,101 @@ class LX225:
         )
         self._vin_limits = self.get_vin_limits(poll_hardware=True)
         self._temp_limit = self.get_temp_limit(poll_hardware=True)
-        self._motor_mode = self.is_motor_mode(poll_hardware=True)
-        self._motor_speed = (
-            self.get_motor_speed(poll_hardware=True) if self._motor_mode else None
-        )
+
+        # motor mode and speed come in the same reply
+        LX225._send_frame(self._frames["get_motor_mode"])
+        mode, speed = _MOTOR_MODE_REPLY.unpack(LX225._read_packet(4, self._id))
+        self._motor_mode = mode == 1
+        self._motor_speed = speed if self._motor_mode else None
+
         self._torque_enabled = self.is_torque_enabled(poll_hardware=True)
         self._led_powered = self.is_led_power_on(poll_hardware=True)
         self._led_error_triggers = self.get_led_error_triggers(poll_hardware=True)
 
-        if disable_torque:
-            self.disable_torque()
-        else:
-            self.enable_torque()
+    def get_state(self) -> dict:
+        return {name: getattr(self, name) for name in LX225._CACHED_STATE}
 
     ############### Utility Functions ###############
 
     @staticmethod
-    def _checksum(packet: list[int]) -> int:
-        s = ~sum(packet[2:])
-        return s % 256
+    def _checksum(packet: Union[bytes, bytearray]) -> int:
+        return ~sum(memoryview(packet)[2:]) & 0xFF
 
+    # Validates a received frame, returns its payload
     @staticmethod
-    def _to_bytes(n: int) -> tuple[int, int]:
-        return n % 256, n // 256
-
-    @staticmethod
-    def _check_packet(packet: list[int], servo_id: int) -> None:
-        if sum(packet) == 0:
-            raise ServoTimeoutError(f"Servo {servo_id}: not responding", servo_id)
-        if LX225._checksum(packet[:-1]) != packet[-1]:
-            LX225._controller.flushInput()
-            raise ServoChecksumError(f"Servo {servo_id}: bad checksum", servo_id)
-
-    @staticmethod
-    def _send_packet(packet: list[int]) -> None:
-        packet = [0x55, 0x55, *packet]
-        packet.append(LX225._checksum(packet))
-        LX225._controller.write(bytes(packet))
-
-    @staticmethod
-    def _read_packet(num_bytes: int, servo_id: int) -> list[int]:
-        received = LX225._controller.read(num_bytes + 6)
-
+    def _parse_packet(received: bytes, num_bytes: int, servo_id: int) -> bytes:
         if len(received) != num_bytes + 6:
             raise ServoTimeoutError(
                 f"Servo {servo_id}: {len(received)} bytes (expected {num_bytes})",
                 servo_id,
             )
 
+        if received[:2] != _HEADER:
+            # out of sync with the replies, drop whatever is left
+            LX225._controller.reset_input_buffer()
+            raise ServoChecksumError(f"Servo {servo_id}: bad packet header", servo_id)
+
+        if received[2] != servo_id:
+            # a late reply to another servo's request
+            raise ServoChecksumError(f"Servo {servo_id}: reply from servo {received[2]}", servo_id)
+
+        if received[3] != num_bytes + 3:
+            raise ServoChecksumError(f"Servo {servo_id}: bad packet length", servo_id)
+
         if LX225._checksum(received[:-1]) != received[-1]:
             raise ServoChecksumError(f"Servo {servo_id}: bad checksum", servo_id)
 
-        return list(received[5:-1])
+        return received[5:-1]
+
+    @staticmethod
+    def _frame(packet: bytes) -> bytes:
+        frame = bytearray(_HEADER)
+        frame.extend(packet)
+        frame.append(LX225._checksum(frame))
+        return bytes(frame)
+
+    def _build_frames(self) -> None:
+        self._frames = {
+            name: LX225._frame(bytes((self._id, *packet)))
+            for name, packet in LX225._FIXED_PACKETS.items()
+        }
+
+    @staticmethod
+    def _send_frame(frame: bytes) -> None:
+        tx_buffer = LX225._tx_buffer
+        if tx_buffer is not None:
+            tx_buffer.append(frame)
+        else:
+            _write(frame)
+
+    @staticmethod
+    def _send_packet(packet: bytes) -> None:
+        LX225._send_frame(LX225._frame(packet))
+
+    # pyserial's read already waits until num_bytes arrive or the port
+    # timeout runs out, a short result means the reply timed out.
+    @staticmethod
+    def _read_exact(num_bytes: int) -> bytes:
+        return _read(num_bytes)
+
+    @staticmethod
+    def _read_packet(num_bytes: int, servo_id: int) -> bytes:
+        tx_buffer = LX225._tx_buffer
+        if tx_buffer:
+            # the request we are waiting on might still be queued
+            LX225.send_bulk(tx_buffer)
+            tx_buffer.clear()
+
+        received = LX225._read_exact(num_bytes + 6)
+        return LX225._parse_packet(received, num_bytes, servo_id)
+
+    @staticmethod
+    def _signed_byte(value: int) -> int:
+        return (value ^ 0x80) - 0x80
 
     @staticmethod
     def _to_servo_range(angle: float) -> int:
-        return round(angle * 100 / 27)
+        return round(angle * _SERVO_UNITS_PER_DEGREE)
 
     @staticmethod
     def _from_servo_range(angle: int) -> float:
@@ -172,12 +395,13 @@ class LX225:
         if relative:
             angle += self._commanded_angle
 
-        if wait:
-            packet = [self._id, 7, 7, *LX225._to_bytes(angle), *LX225._to_bytes(time)]
-        else:
-            packet = [self._id, 7, 1, *LX225._to_bytes(angle), *LX225._to_bytes(time)]
+        frame = LX225._move_frame
+        _WORD_PAIR_PACKET.pack_into(
+            frame, 2, self._id, 7, _MOVE_COMMANDS[bool(wait)], angle, time
+        )
+        frame[-1] = LX225._checksum(LX225._move_view[:-1])
 
-        LX225._send_packet(packet)
+        LX225._send_frame(bytes(frame))
 
         if wait:
             self._waiting_angle = angle
@@ -198,8 +422,7 @@ class LX225:
                 self._id,
             )
 
-        packet = [self._id, 3, 11]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["move_start"])
 
         self._commanded_angle = self._waiting_angle
         self._waiting_for_move = False
@@ -211,17 +434,17 @@ class LX225:
                 self._id,
             )
 
-        packet = [self._id, 3, 12]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["move_stop"])
 
         self._commanded_angle = LX225._to_servo_range(self.get_physical_angle())
 
     def set_id(self, id_: int) -> None:
         LX225._check_within_limits(id_, 0, 253, "servo ID", self._id)
 
-        packet = [self._id, 4, 13, id_]
+        packet = _BYTE_PACKET.pack(self._id, 4, 13, id_)
         LX225._send_packet(packet)
         self._id = id_
+        self._build_frames()
 
     def set_angle_offset(self, offset: int, permanent: bool = False) -> None:
         LX225._check_within_limits(offset, -30, 30, "angle offset", self._id)
@@ -230,13 +453,12 @@ class LX225:
         if offset < 0:
             offset = 256 + offset
 
-        packet = [self._id, 4, 17, offset]
+        packet = _BYTE_PACKET.pack(self._id, 4, 17, offset)
         LX225._send_packet(packet)
         self._angle_offset = offset
 
         if permanent:
-            packet = [self._id, 3, 18]
-            LX225._send_packet(packet)
+            LX225._send_frame(self._frames["save_angle_offset"])
 
     def set_angle_limits(self, lower_limit: float, upper_limit: float) -> None:
         LX225._check_within_limits(lower_limit, 0, 270, "lower limit", self._id)
@@ -250,13 +472,7 @@ class LX225:
         lower_limit = LX225._to_servo_range(lower_limit)
         upper_limit = LX225._to_servo_range(upper_limit)
 
-        packet = [
-            self._id,
-            7,
-            20,
-            *LX225._to_bytes(lower_limit),
-            *LX225._to_bytes(upper_limit),
-        ]
+        packet = _WORD_PAIR_PACKET.pack(self._id, 7, 20, lower_limit, upper_limit)
         LX225._send_packet(packet)
         self._angle_limits = lower_limit, upper_limit
 
@@ -269,20 +485,14 @@ class LX225:
                 self._id,
             )
 
-        packet = [
-            self._id,
-            7,
-            22,
-            *LX225._to_bytes(lower_limit),
-            *LX225._to_bytes(upper_limit),
-        ]
+        packet = _WORD_PAIR_PACKET.pack(self._id, 7, 22, lower_limit, upper_limit)
         LX225._send_packet(packet)
         self._vin_limits = lower_limit, upper_limit
 
     def set_temp_limit(self, upper_limit: int) -> None:
         LX225._check_within_limits(upper_limit, 50, 100, "temperature limit", self._id)
 
-        packet = [self._id, 4, 24, upper_limit]
+        packet = _BYTE_PACKET.pack(self._id, 4, 24, upper_limit)
         LX225._send_packet(packet)
         self._temp_limit = upper_limit
 
@@ -299,7 +509,7 @@ class LX225:
         if speed < 0:
             speed += 65536
 
-        packet = [self._id, 7, 29, 1, 0, *LX225._to_bytes(speed)]
+        packet = _MOTOR_MODE_PACKET.pack(self._id, 7, 29, 1, 0, speed)
         LX225._send_packet(packet)
         self._motor_mode = True
 
@@ -307,46 +517,36 @@ class LX225:
         # if not self._motor_mode:
         #   raise ServoLogicalError(f'Servo {self._id}: servo is already in servo mode')
 
-        packet = [self._id, 7, 29, 0, 0, 0, 0]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["servo_mode"])
         self._motor_mode = False
 
     def enable_torque(self) -> None:
-        packet = [self._id, 4, 31, 0]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["enable_torque"])
         self._torque_enabled = True
 
     def disable_torque(self) -> None:
-        packet = [self._id, 4, 31, 1]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["disable_torque"])
         self._torque_enabled = False
 
     ################ Read Commands ################
 
     def get_last_instant_move_hw(self) -> tuple[float, int]:
-        packet = [self._id, 3, 2]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_last_instant_move"])
 
-        received = LX225._read_packet(4, self._id)
-        angle = LX225._from_servo_range(received[0] + received[1] * 256)
-        time = received[2] + received[3] * 256
-        return angle, time
+        angle, time = _WORD_PAIR_REPLY.unpack(LX225._read_packet(4, self._id))
+        return LX225._from_servo_range(angle), time
 
     def get_last_delayed_move_hw(self) -> tuple[float, int]:
-        packet = [self._id, 3, 8]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_last_delayed_move"])
 
-        received = LX225._read_packet(4, self._id)
-        angle = LX225._from_servo_range(received[0] + received[1] * 256)
-        time = received[2] + received[3] * 256
-        return angle, time
+        angle, time = _WORD_PAIR_REPLY.unpack(LX225._read_packet(4, self._id))
+        return LX225._from_servo_range(angle), time
 
     def get_id(self, poll_hardware: bool = False) -> int:
         if not poll_hardware:
             return self._id
 
-        packet = [self._id, 3, 14]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_id"])
 
         received = LX225._read_packet(1, self._id)
         return received[0]
@@ -355,14 +555,10 @@ class LX225:
         if not poll_hardware:
             return LX225._from_servo_range(self._angle_offset)
 
-        packet = [self._id, 3, 19]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_angle_offset"])
 
         received = LX225._read_packet(1, self._id)
-        if received[0] > 125:
-            return LX225._from_servo_range(received[0] - 256)
-
-        return LX225._from_servo_range(received[0])
+        return LX225._from_servo_range(LX225._signed_byte(received[0]))
 
     def get_angle_limits(self, poll_hardware: bool = False) -> tuple[float, float]:
         if not poll_hardware:
@@ -370,32 +566,29 @@ class LX225:
                 self._angle_limits[0]
             ), LX225._from_servo_range(self._angle_limits[1])
 
-        packet = [self._id, 3, 21]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_angle_limits"])
 
-        received = LX225._read_packet(4, self._id)
-        lower_limit = LX225._from_servo_range(received[0] + received[1] * 256)
-        upper_limit = LX225._from_servo_range(received[2] + received[3] * 256)
-        return lower_limit, upper_limit
+        lower_limit, upper_limit = _WORD_PAIR_REPLY.unpack(
+            LX225._read_packet(4, self._id)
+        )
+        return (
+            LX225._from_servo_range(lower_limit),
+            LX225._from_servo_range(upper_limit),
+        )
 
     def get_vin_limits(self, poll_hardware: bool = False) -> tuple[int, int]:
         if not poll_hardware:
             return self._vin_limits
 
-        packet = [self._id, 3, 23]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_vin_limits"])
 
-        received = LX225._read_packet(4, self._id)
-        lower_limit = received[0] + received[1] * 256
-        upper_limit = received[2] + received[3] * 256
-        return lower_limit, upper_limit
+        return _WORD_PAIR_REPLY.unpack(LX225._read_packet(4, self._id))
 
     def get_temp_limit(self, poll_hardware: bool = False) -> int:
         if not poll_hardware:
             return self._temp_limit
 
-        packet = [self._id, 3, 25]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_temp_limit"])
 
         received = LX225._read_packet(1, self._id)
         return received[0]
@@ -404,8 +597,7 @@ class LX225:
         if not poll_hardware:
             return self._motor_mode
 
-        packet = [self._id, 3, 30]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_motor_mode"])
 
         received = LX225._read_packet(4, self._id)
         return received[0] == 1
@@ -417,13 +609,11 @@ class LX225:
         if not poll_hardware:
             return self._motor_speed
 
-        packet = [self._id, 3, 30]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_motor_mode"])
 
-        received = LX225._read_packet(4, self._id)
-        if received[0] == 1:
-            speed = received[2] + received[3] * 256
-            return speed - 65536 if speed > 32767 else speed
+        mode, speed = _MOTOR_MODE_REPLY.unpack(LX225._read_packet(4, self._id))
+        if mode == 1:
+            return speed
 
         return None
 
@@ -431,8 +621,7 @@ class LX225:
         if not poll_hardware:
             return self._torque_enabled
 
-        packet = [self._id, 3, 32]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_torque_state"])
 
         received = LX225._read_packet(1, self._id)
         return received[0] == 1
@@ -441,8 +630,7 @@ class LX225:
         if not poll_hardware:
             return self._led_powered
 
-        packet = [self._id, 3, 34]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_led_power"])
 
         received = LX225._read_packet(1, self._id)
         return received[0] == 0
@@ -453,8 +641,7 @@ class LX225:
         if not poll_hardware:
             return self._led_error_triggers
 
-        packet = [self._id, 3, 36]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_led_error_triggers"])
 
         received = LX225._read_packet(1, self._id)
         over_temperature = received[0] & 1 != 0
@@ -463,26 +650,23 @@ class LX225:
         return over_temperature, over_voltage, rotor_locked
 
     def get_temp(self) -> int:
-        packet = [self._id, 3, 26]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_temp"])
 
         received = LX225._read_packet(1, self._id)
         return received[0]
 
     def get_vin(self) -> int:
-        packet = [self._id, 3, 27]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_vin"])
 
         received = LX225._read_packet(2, self._id)
-        return received[0] + received[1] * 256
+        return int.from_bytes(received, "little")
 
     def get_physical_angle(self) -> float:
-        packet = [self._id, 3, 28]
-        LX225._send_packet(packet)
+        LX225._send_frame(self._frames["get_physical_angle"])
 
         received = LX225._read_packet(2, self._id)
-        angle = received[0] + received[1] * 256
-        return LX225._from_servo_range(angle - 65536 if angle > 32767 else angle)
+        angle = int.from_bytes(received, "little", signed=True)
+        return LX225._from_servo_range(angle)
 
     def get_commanded_angle(self) -> float:
         return LX225._from_servo_range(self._commanded_angle)
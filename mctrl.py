@@ -1,4 +1,4 @@
-from math import sin, cos, copysign
+from enum import IntEnum
 from lx225 import *
 import time
 import atexit
@@ -13,7 +13,26 @@ import atexit
 # The newer servo with 360 deg magnetic position encoder should allow to change
 # that in the future.
 
+# Clock for the motor busy deadlines (unaffected by system clock changes)
+_monotonic = time.monotonic
+
+# Returns the sign of x as -1, 0 or 1
+def _sgn(x) -> int:
+    return -1 if x < 0 else (1 if x > 0 else 0)
+
+# Zoom and focus motor states
+class MotorState(IntEnum):
+    UNINITIALIZED = 0
+    READY = 1
+    BUSY = 2
+
+    def __str__(self) -> str:
+        return self.name
+
 class MCTRLSettings:
+    __slots__ = ("com_port", "zoom_motor_id", "focus_motor_id", "timer_interval", "focus_step_speed",
+                 "serial_timeout", "zoom_min_angle", "zoom_max_angle", "zoom_in_to_max_time")
+
     def __init__(self) -> None:
         self.com_port : str = "COM1"           # serial port to use
         self.zoom_motor_id : int = 1           # ID of the zoom motor
@@ -25,12 +44,28 @@ class MCTRLSettings:
         self.zoom_max_angle : float = 270.0    # zoom max angle position
         self.zoom_in_to_max_time : float = 5.0 # seconds to change zoom from its min to max or back (determines zoom motor speed)
 
+    # Create the settings from a dict of {attribute name: value}, the values
+    # (e.g. strings read from a config file) are converted to the attribute type
+    # values : settings to change from their defaults
+    @staticmethod
+    def from_dict(values : dict) -> "MCTRLSettings":
+        s = MCTRLSettings()
+        for name, value in values.items():
+            setattr(s, name, type(getattr(s, name))(value))
+        return s
+
 class MCTRL:
-    zoom_motor_state = "UNINITIALIZED"
-    focus_motor_state = "UNINITIALIZED"
+    zoom_motor_state = MotorState.UNINITIALIZED
+    focus_motor_state = MotorState.UNINITIALIZED
     focus_position = 0 # curret position (in steps, whatever they are)
     focus_steps = 0    # steps to make (up or down)
     s = MCTRLSettings()
+    zoom_motor = None
+    focus_motor = None
+    zoom_motor_busy_until_time = 0.0 # zoom move end time (monotonic clock)
+    _focus_motor_mode = None
+    _focus_step_speed = 0
+    _focus_small_step_time = 0.0
 
     # Call to init motor controller
     # _s : motor controller settings
@@ -44,62 +79,90 @@ class MCTRL:
         LX225.initialize(MCTRL.s.com_port, MCTRL.s.serial_timeout)
         if MCTRL.s.zoom_motor_id != 0:
             MCTRL.zoom_motor = LX225(MCTRL.s.zoom_motor_id)
-            MCTRL.zoom_motor.servo_mode()
-            MCTRL.zoom_motor.set_angle_limits(0, 270)
-            MCTRL.zoom_motor.disable_torque()
-            MCTRL.set_zoom_motor_state("READY")
+            with LX225.batch():
+                MCTRL.zoom_motor.servo_mode()
+                MCTRL.zoom_motor.set_angle_limits(0, 270)
+                MCTRL.zoom_motor.disable_torque()
+            MCTRL.set_zoom_motor_state(MotorState.READY)
         if MCTRL.s.focus_motor_id != 0:
             MCTRL.focus_motor = LX225(MCTRL.s.focus_motor_id)
-            MCTRL.focus_motor.motor_mode(0)
-            MCTRL.focus_motor.disable_torque()
+            with LX225.batch():
+                MCTRL.focus_motor.motor_mode(0)
+                MCTRL.focus_motor.disable_torque()
+            # bound once, used for every focuser step
+            MCTRL._focus_motor_mode = MCTRL.focus_motor.motor_mode
+            MCTRL._focus_step_speed = MCTRL.s.focus_step_speed
+            MCTRL._focus_small_step_time = MCTRL.s.timer_interval / 10.0
             MCTRL.focus_position = 0
             MCTRL.focus_steps = 0
-            MCTRL.set_focus_motor_state("READY")
-        time.sleep(1.0) # Without this the initial position read times out
+            MCTRL.set_focus_motor_state(MotorState.READY)
+        MCTRL.wait_motors_ready()
+
+    # Right after the setup the initial position read times out, poll the
+    # motors with growing pauses until they answer (gives up after ~1.5 sec
+    # of pauses plus a serial timeout per failed probe, ~2.5 sec in total)
+    @staticmethod
+    def wait_motors_ready() -> None:
+        motors = []
+        if MCTRL.zoom_motor_state != MotorState.UNINITIALIZED:
+            motors.append(MCTRL.zoom_motor)
+        if MCTRL.focus_motor_state != MotorState.UNINITIALIZED:
+            motors.append(MCTRL.focus_motor)
+        for delay in (0.05, 0.1, 0.2, 0.4, 0.8):
+            time.sleep(delay)
+            LX225.reset_input_buffer() # drop the replies that came in late
+            try:
+                for motor in motors:
+                    motor.get_physical_angle()
+                return
+            except ServoError:
+                pass
+        LX225.reset_input_buffer() # gave up, drop whatever the last probe left
 
     # set zoom motor state
     @staticmethod
-    def set_zoom_motor_state(s) -> None:
+    def set_zoom_motor_state(s : MotorState) -> None:
         #print(f"zoom: {MCTRL.zoom_motor_state} -> {s}")
         MCTRL.zoom_motor_state = s
 
     # set focus motor state
     @staticmethod
-    def set_focus_motor_state(s) -> None:
+    def set_focus_motor_state(s : MotorState) -> None:
         #print(f"zoom: {MCTRL.focus_motor_state} -> {s}")
         MCTRL.focus_motor_state = s
 
     # Call to shut down motor controller
     @staticmethod
     def shutdown() -> None:
-        if MCTRL.zoom_motor_state != "UNINITIALIZED":
+        if MCTRL.zoom_motor_state != MotorState.UNINITIALIZED:
             MCTRL.zoom_motor.disable_torque()
-            MCTRL.set_zoom_motor_state("UNINITIALIZED")
-        if MCTRL.focus_motor_state != "UNINITIALIZED":
+            MCTRL.set_zoom_motor_state(MotorState.UNINITIALIZED)
+        if MCTRL.focus_motor_state != MotorState.UNINITIALIZED:
             MCTRL.focus_motor.disable_torque()
-            MCTRL.set_focus_motor_state("UNINITIALIZED")
-        del MCTRL.zoom_motor
-        del MCTRL.focus_motor
-        LX255.close()
+            MCTRL.set_focus_motor_state(MotorState.UNINITIALIZED)
+        MCTRL.zoom_motor = None
+        MCTRL.focus_motor = None
+        MCTRL._focus_motor_mode = None
+        LX225.close()
 
     # Timer tick (called every 0.1 sec)
     # Returns a list of strings for the caller to act upon
     @staticmethod
     def timer_tick():
         ret = []
-        if MCTRL.zoom_motor_state == "BUSY":
-            if MCTRL.zoom_motor_busy_until_time < time.time():
+        if MCTRL.zoom_motor_state == MotorState.BUSY:
+            if MCTRL.zoom_motor_busy_until_time < _monotonic():
                 MCTRL.zoom_motor.disable_torque()
-                MCTRL.set_zoom_motor_state("READY")
+                MCTRL.set_zoom_motor_state(MotorState.READY)
                 ret.append("ZOOM_DONE")
             else:
                 ret.append("ZOOM_MOVING")
 
-        if MCTRL.focus_motor_state == "BUSY":
+        if MCTRL.focus_motor_state == MotorState.BUSY:
             if MCTRL.focus_steps == 0:
-                MCTRL.focus_motor.motor_mode(0);
+                MCTRL._focus_motor_mode(0)
                 MCTRL.focus_motor.disable_torque()
-                MCTRL.set_focus_motor_state("READY")
+                MCTRL.set_focus_motor_state(MotorState.READY)
                 ret.append("FOCUS_DONE")
             else:
                 MCTRL.focus_do_steps()
@@ -111,7 +174,7 @@ class MCTRL:
     @staticmethod
     def get_zoom_current_level():
         val = None
-        if MCTRL.zoom_motor_state != "UNINITIALIZED":
+        if MCTRL.zoom_motor_state != MotorState.UNINITIALIZED:
             angle = MCTRL.zoom_motor.get_physical_angle()
             val = (angle - MCTRL.s.zoom_min_angle) / (MCTRL.s.zoom_max_angle - MCTRL.s.zoom_min_angle)
             if val < 0.0:
@@ -128,14 +191,14 @@ class MCTRL:
             raise ServoArgumentError(
                 f"Trget zoom value {val} must be normalized to the range from 0.0 to 1.0"
             )
-        if MCTRL.zoom_motor_state == "UNINITIALIZED":
+        if MCTRL.zoom_motor_state == MotorState.UNINITIALIZED:
             raise ServoLogicalError(
                 f"Zoom motor is not initialized!"
             )
-        elif MCTRL.zoom_motor_state == "BUSY":
+        elif MCTRL.zoom_motor_state == MotorState.BUSY:
             MCTRL.zoom_motor.disable_torque()
-            MCTRL.set_zoom_motor_state("READY")
-        elif MCTRL.zoom_motor_state == "READY":
+            MCTRL.set_zoom_motor_state(MotorState.READY)
+        elif MCTRL.zoom_motor_state == MotorState.READY:
             pass
         else:
             raise ServoLogicalError(
@@ -144,14 +207,14 @@ class MCTRL:
         old_angle_norm = MCTRL.get_zoom_current_level()
         new_angle_real = MCTRL.s.zoom_min_angle + val * (MCTRL.s.zoom_max_angle - MCTRL.s.zoom_min_angle)
         wait_time = MCTRL.s.zoom_in_to_max_time * abs(val - old_angle_norm)
-        time_ms = int(round(wait_time * 1000)) # the motor takes time in milliseconds (accepted range 0 - 30000)
+        time_ms = int(wait_time * 1000 + 0.5) # the motor takes time in milliseconds (accepted range 0 - 30000)
         if time_ms > 30000:
             time_ms = 30000
-        if MCTRL.zoom_motor_state == "READY":
+        if MCTRL.zoom_motor_state == MotorState.READY:
             MCTRL.zoom_motor.enable_torque()
             MCTRL.zoom_motor.move(new_angle_real, time_ms)
-            MCTRL.zoom_motor_busy_until_time = time.time() + wait_time + 0.1 + (wait_time * 0.1) # give it 0.1sec + 10% extra time
-            MCTRL.set_zoom_motor_state("BUSY")
+            MCTRL.zoom_motor_busy_until_time = _monotonic() + wait_time + 0.1 + (wait_time * 0.1) # give it 0.1sec + 10% extra time
+            MCTRL.set_zoom_motor_state(MotorState.BUSY)
 
 
     # Returns the focuser position in "steps" made (can be negative)
@@ -163,7 +226,7 @@ class MCTRL:
     @staticmethod
     def get_focus_current_angle():
         val = None
-        if MCTRL.focus_motor_state != "UNINITIALIZED":
+        if MCTRL.focus_motor_state != MotorState.UNINITIALIZED:
             val = MCTRL.focus_motor.get_physical_angle()
         return val
 
@@ -175,15 +238,15 @@ class MCTRL:
     # Inititate the focuser move up or down (or update if already moving) to the requested number of "steps"
     @staticmethod
     def move_focus(value) -> None:
-        if MCTRL.focus_motor_state == "UNINITIALIZED":
+        if MCTRL.focus_motor_state == MotorState.UNINITIALIZED:
             raise ServoLogicalError(
                 f"Focuser motor is not initialized!"
             )
-        elif MCTRL.focus_motor_state == "READY":
+        elif MCTRL.focus_motor_state == MotorState.READY:
             MCTRL.focus_motor.enable_torque()
             MCTRL.focus_steps = value
-            MCTRL.set_focus_motor_state("BUSY")
-        elif MCTRL.focus_motor_state == "BUSY":
+            MCTRL.set_focus_motor_state(MotorState.BUSY)
+        elif MCTRL.focus_motor_state == MotorState.BUSY:
             MCTRL.focus_steps += value
         else:
             raise ServoLogicalError(
@@ -194,24 +257,32 @@ class MCTRL:
     # Performs one step (blocking app)
     @staticmethod
     def focus_do_steps() -> None:
-        MCTRL.focus_motor.motor_mode(int(copysign(MCTRL.s.focus_step_speed, MCTRL.focus_steps)));
+        motor_mode = MCTRL._focus_motor_mode
+        sign = _sgn(MCTRL.focus_steps)
+        motor_mode(sign * MCTRL._focus_step_speed)
         if abs(MCTRL.focus_steps) < 10: # for small steps
-            time.sleep(MCTRL.s.timer_interval / 10.0)
-            MCTRL.focus_motor.motor_mode(0);
-            MCTRL.focus_position += int(copysign(1, MCTRL.focus_steps))
-            MCTRL.focus_steps -= int(copysign(1, MCTRL.focus_steps))
+            time.sleep(MCTRL._focus_small_step_time)
+            motor_mode(0)
+            MCTRL.focus_position += sign
+            MCTRL.focus_steps -= sign
         else:
-            MCTRL.focus_position += int(copysign(10, MCTRL.focus_steps))
-            MCTRL.focus_steps -= int(copysign(10, MCTRL.focus_steps))
+            MCTRL.focus_position += 10 * sign
+            MCTRL.focus_steps -= 10 * sign
         
     # Check if Zoom is enabled
     # Returns true if the Zoom motor is initialized
     @staticmethod
     def is_zoom_enabled():
-        return MCTRL.zoom_motor_state != "UNINITIALIZED"
+        return MCTRL.zoom_motor_state != MotorState.UNINITIALIZED
 
     # Check if Zoom is enabled
     # Returns true if the Zoom motor is initialized
     @staticmethod
     def is_focus_enabled():
-        return MCTRL.focus_motor_state != "UNINITIALIZED"
+        return MCTRL.focus_motor_state != MotorState.UNINITIALIZED
+
+    # Check if any of the motors is moving
+    # Returns true if timer_tick() calls are needed to complete the moves
+    @staticmethod
+    def is_busy():
+        return MCTRL.zoom_motor_state == MotorState.BUSY or MCTRL.focus_motor_state == MotorState.BUSY
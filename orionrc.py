@@ -3,6 +3,7 @@
 import wx
 import os
 import configparser
+import time
 from mctrl import *
 
 # Get the Windows user home directory
@@ -12,6 +13,9 @@ USER_HOME = os.path.expanduser("~")
 WINDOW_CONFIG_FILE = os.path.join(USER_HOME, "orionrc_window_config.ini")
 APP_CONFIG_FILE = os.path.join(USER_HOME, "orionrc_app_config.ini")
 
+# Clock for the focuser position refresh throttling
+_now = time.time
+
 # Global timer firing rate in milliseconds
 TIMER_INTERVAL_MS = 100
 
@@ -26,11 +30,46 @@ DEFAULT_SETTINGS = {
 # Zoom min and max values for zoom control
 ZOOM_MIN_VAL = 8
 ZOOM_MAX_VAL = 24
+_ZOOM_SPAN = float(ZOOM_MAX_VAL - ZOOM_MIN_VAL)
+_ZOOM_SPAN_INV = 1.0 / _ZOOM_SPAN
 
 # Controls if the application needs to be restarted after closing
 global NEED_RESTART
 NEED_RESTART = False
 
+# Config file sections parsed so far: {path: (file mtime, {option: value})}
+# Lets the app restarts reuse them while the files stay unchanged.
+_CONFIG_CACHE = {}
+
+# Read a section of the config file (empty dict if the file can't be accessed or the section is missing)
+def read_config_section(path, section):
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    config = configparser.ConfigParser()
+    config.read(path)
+    values = dict(config[section]) if config.has_section(section) else {}
+    _CONFIG_CACHE[path] = (mtime, values)
+    return values
+
+# Remember the section values just written to the config file
+def cache_config_section(path, values):
+    _CONFIG_CACHE[path] = (os.stat(path).st_mtime_ns, {k: v.strip() for k, v in values.items()})
+
+# Write the config file with a single section, the old file is only replaced
+# once the new one is completely written
+def write_config_section(path, section, values):
+    text = f"[{section}]\n" + "\n".join(f"{k} = {v}" for k, v in values.items()) + "\n"
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as configfile:
+        configfile.write(text)
+    os.replace(tmp_path, path)
+    cache_config_section(path, values)
+
 class MyApp(wx.App):
     def OnInit(self):
         frame = MyFrame(None, title="OrionRc")
@@ -44,15 +83,23 @@ class MyFrame(wx.Frame):
 
         # Create a panel to hold the widgets
         panel = wx.Panel(self)
+        self.panel = panel
 
         # Create a notebook (tabbed interface)
         notebook = wx.Notebook(panel)
 
+        # The Focus and Settings tab widgets are created when the tab is first shown
+        self._built = {"Focus": False, "Settings": False}
+        notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, lambda event: self.on_page_changed(event, notebook))
+
         # Add the tabs to the notebook
         self.setup_zoom_tab(notebook)
         self.setup_focus_tab(notebook)
         self.setup_settings_tab(notebook)
 
+        # Tab page indices by the tab text (kept up to date by remove_tab)
+        self._tabs = {notebook.GetPageText(ii): ii for ii in range(notebook.GetPageCount())}
+
         # Create a box sizer for the overall layout
         vbox = wx.BoxSizer(wx.VERTICAL)
 
@@ -68,16 +115,25 @@ class MyFrame(wx.Frame):
         # Load the initial window position and size from the configuration file
         self.load_window_position_and_size()
 
-        # Load settings from the configuration file, prep MCTRLSettings instance
-        self.settings = MCTRLSettings()
+        # Load settings from the configuration file into the MCTRLSettings instance
         self.load_settings()
 
         # Bind the EVT_CLOSE event to the OnClose method
         self.Bind(wx.EVT_CLOSE, self.OnClose)
 
-        # Create and start the wx Timer
+        # Last time the focuser position was refreshed while moving
+        self.last_moving = 0.0
+
+        # Last strings shown in the read-only fields (skip repainting unchanged ones)
+        self._last_zoom_str = None
+        self._last_steps_str = None
+        self._last_angle_str = None
+
+        # Latest slider zoom level not yet sent to the motor (applied on the next tick)
+        self._pending_zoom = None
+
+        # Create the wx Timer, it runs only while the motors have work to do (see start_timer)
         self.timer = wx.Timer(self)
-        self.timer.Start(TIMER_INTERVAL_MS)  # Set the timer firing rate in milliseconds
         self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)  # Bind the timer event to the on_timer method
 
         # Initialize the motor controller
@@ -86,6 +142,10 @@ class MyFrame(wx.Frame):
         except Exception as e:
             wx.MessageBox(f"Error initializing the motor controller: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
 
+        # The motors are only enabled by MCTRL.initialize(), remember which ones are
+        self._zoom_en = MCTRL.is_zoom_enabled()
+        self._focus_en = MCTRL.is_focus_enabled()
+
         # Set the initial slider position and "Current Zoom Level" on the zoom tab
         # If not enabled or not working remove the tab
         if not self.set_zoom_current_values():
@@ -96,6 +156,9 @@ class MyFrame(wx.Frame):
         if not self.set_focus_current_values():
             self.remove_tab(notebook, "Focus")
 
+        # Build the page left selected if the Zoom tab was removed
+        self.build_tab_page(notebook, notebook.GetSelection())
+
     def setup_zoom_tab(self, notebook):
         zoom_tab = wx.Panel(notebook)
         hbox_zoom = wx.BoxSizer(wx.HORIZONTAL)  # Use horizontal box sizer
@@ -131,6 +194,9 @@ class MyFrame(wx.Frame):
 
     def setup_focus_tab(self, notebook):
         focus_tab = wx.Panel(notebook)
+        notebook.AddPage(focus_tab, "Focus")
+
+    def build_focus_tab(self, focus_tab):
         vbox_focus = wx.BoxSizer(wx.VERTICAL)
 
         hbox_current_steps = wx.BoxSizer(wx.HORIZONTAL)
@@ -164,19 +230,15 @@ class MyFrame(wx.Frame):
         vbox_up.Add(up_label, flag=wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, border=10)
 
         self.up_button_values = [1, 10, 100, 1000]
-        for value in self.up_button_values:
-            button = wx.Button(focus_tab, label=str(value))
-            vbox_up.Add(button, flag=wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, border=5)
-            button.Bind(wx.EVT_BUTTON, lambda event, value=value: self.on_focus_button(event, value))
+        vbox_up.AddMany([(self.make_focus_button(focus_tab, value), 0, wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, 5)
+                         for value in self.up_button_values])
 
         down_label = wx.StaticText(focus_tab, label="Down:")
         vbox_down.Add(down_label, flag=wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, border=10)
 
         self.down_button_values = [-1, -10, -100, -1000]
-        for value in self.down_button_values:
-            button = wx.Button(focus_tab, label=str(abs(value)))
-            vbox_down.Add(button, flag=wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, border=5)
-            button.Bind(wx.EVT_BUTTON, lambda event, value=value: self.on_focus_button(event, value))
+        vbox_down.AddMany([(self.make_focus_button(focus_tab, value), 0, wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, 5)
+                           for value in self.down_button_values])
 
         hbox_buttons.Add(vbox_up, flag=wx.EXPAND|wx.ALL, border=10)
         hbox_buttons.Add(vbox_down, flag=wx.EXPAND|wx.ALL, border=10)
@@ -185,10 +247,18 @@ class MyFrame(wx.Frame):
 
         focus_tab.SetSizer(vbox_focus)
 
-        notebook.AddPage(focus_tab, "Focus")
+    # Create the focuser button for moving 'value' steps up (positive) or down (negative)
+    def make_focus_button(self, focus_tab, value):
+        button = wx.Button(focus_tab, label=str(abs(value)))
+        button.step_value = value
+        button.Bind(wx.EVT_BUTTON, self.on_focus_button)
+        return button
 
     def setup_settings_tab(self, notebook):
         settings_tab = wx.Panel(notebook)
+        notebook.AddPage(settings_tab, "Settings")
+
+    def build_settings_tab(self, settings_tab):
         vbox_settings = wx.BoxSizer(wx.VERTICAL)
 
         # Create a grid sizer for the labels and input fields
@@ -196,23 +266,24 @@ class MyFrame(wx.Frame):
 
         com_port_label = wx.StaticText(settings_tab, label=f"COM Port [{DEFAULT_SETTINGS['com_port']}]:")
         self.com_port_input = wx.TextCtrl(settings_tab)
-        grid_sizer.Add(com_port_label, flag=wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL|wx.ALL, border=10)
-        grid_sizer.Add(self.com_port_input, flag=wx.EXPAND|wx.ALL, border=10)
 
         zoom_id_label = wx.StaticText(settings_tab, label=f"Zoom Motor ID [{DEFAULT_SETTINGS['zoom_id']}]:")
         self.zoom_id_input = wx.TextCtrl(settings_tab)
-        grid_sizer.Add(zoom_id_label, flag=wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL|wx.ALL, border=10)
-        grid_sizer.Add(self.zoom_id_input, flag=wx.EXPAND|wx.ALL, border=10)
 
         focuser_id_label = wx.StaticText(settings_tab, label=f"Focuser Motor ID [{DEFAULT_SETTINGS['focuser_id']}]:")
         self.focuser_id_input = wx.TextCtrl(settings_tab)
-        grid_sizer.Add(focuser_id_label, flag=wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL|wx.ALL, border=10)
-        grid_sizer.Add(self.focuser_id_input, flag=wx.EXPAND|wx.ALL, border=10)
 
         focus_step_speed_label = wx.StaticText(settings_tab, label=f"Focus Step Speed [{DEFAULT_SETTINGS['focus_step_speed']}]:")
         self.focus_step_speed_input = wx.TextCtrl(settings_tab)
-        grid_sizer.Add(focus_step_speed_label, flag=wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL|wx.ALL, border=10)
-        grid_sizer.Add(self.focus_step_speed_input, flag=wx.EXPAND|wx.ALL, border=10)
+
+        label_flags = wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL|wx.ALL
+        input_flags = wx.EXPAND|wx.ALL
+        grid_sizer.AddMany([
+            (com_port_label, 0, label_flags, 10), (self.com_port_input, 0, input_flags, 10),
+            (zoom_id_label, 0, label_flags, 10), (self.zoom_id_input, 0, input_flags, 10),
+            (focuser_id_label, 0, label_flags, 10), (self.focuser_id_input, 0, input_flags, 10),
+            (focus_step_speed_label, 0, label_flags, 10), (self.focus_step_speed_input, 0, input_flags, 10)
+        ])
 
         vbox_settings.Add(grid_sizer, flag=wx.EXPAND|wx.ALL, border=10)
 
@@ -222,25 +293,30 @@ class MyFrame(wx.Frame):
 
         settings_tab.SetSizer(vbox_settings)
 
-        notebook.AddPage(settings_tab, "Settings")
+        # Show the settings loaded at startup
+        self.com_port_input.SetValue(self.loaded_settings["com_port"])
+        self.zoom_id_input.SetValue(self.loaded_settings["zoom_id"])
+        self.focuser_id_input.SetValue(self.loaded_settings["focuser_id"])
+        self.focus_step_speed_input.SetValue(self.loaded_settings["focus_step_speed"])
+        #self.focus_step_period_input.SetValue(self.loaded_settings["focus_step_period"])
+        #self.focus_step_pause_input.SetValue(self.loaded_settings["focus_step_pause"])
 
     def load_window_position_and_size(self):
-        config = configparser.ConfigParser()
-        if os.path.exists(WINDOW_CONFIG_FILE):
-            try:
-                config.read(WINDOW_CONFIG_FILE)
-                x = config.getint("Window", "x")
-                y = config.getint("Window", "y")
-                width = config.getint("Window", "width")
-                height = config.getint("Window", "height")
-                self.SetPosition((x, y))
-                self.SetSize((width, height))
-            except (configparser.NoSectionError, configparser.NoOptionError) as e:
-                wx.MessageBox(f"Error loading window position and size: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
+        try:
+            window = read_config_section(WINDOW_CONFIG_FILE, "Window")
+            if not window:  # nothing saved yet
+                return
+            x = int(window["x"])
+            y = int(window["y"])
+            width = int(window["width"])
+            height = int(window["height"])
+            self.SetPosition((x, y))
+            self.SetSize((width, height))
+        except (configparser.Error, KeyError, ValueError) as e:
+            wx.MessageBox(f"Error loading window position and size: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
 
     def on_save_settings(self, event):
-        config = configparser.ConfigParser()
-        config["Settings"] = {
+        settings = {
             "com_port": self.com_port_input.GetValue(),
             "zoom_id": self.zoom_id_input.GetValue(),
             "focuser_id": self.focuser_id_input.GetValue(),
@@ -250,8 +326,7 @@ class MyFrame(wx.Frame):
         }
 
         try:
-            with open(APP_CONFIG_FILE, "w") as configfile:
-                config.write(configfile)
+            write_config_section(APP_CONFIG_FILE, "Settings", settings)
 
             dlg = wx.MessageDialog(self, "Settings saved successfully. Do you want to restart the application?", "Restart Application", wx.YES_NO | wx.ICON_QUESTION)
             response = dlg.ShowModal()
@@ -264,42 +339,33 @@ class MyFrame(wx.Frame):
             wx.MessageBox(f"Error saving settings: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
 
     def load_settings(self):
-        config = configparser.ConfigParser()
-        if os.path.exists(APP_CONFIG_FILE):
-            try:
-                config.read(APP_CONFIG_FILE)
-            except (configparser.NoSectionError, configparser.NoOptionError) as e:
-                wx.MessageBox(f"Error loading settings: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
-
-        if not config.has_section("Settings"):
-            config.add_section("Settings")
-
-        for option, default_value in DEFAULT_SETTINGS.items():
-            if not config.has_option("Settings", option) or config.get("Settings", option) == "":
-                config.set("Settings", option, default_value)
-
-        self.com_port_input.SetValue(config.get("Settings", "com_port"))
-        self.settings.com_port = config.get("Settings", "com_port")
-        self.zoom_id_input.SetValue(config.get("Settings", "zoom_id"))
-        self.settings.zoom_motor_id = int(config.get("Settings", "zoom_id"))
-        self.focuser_id_input.SetValue(config.get("Settings", "focuser_id"))
-        self.settings.focus_motor_id = int(config.get("Settings", "focuser_id"))
-        self.focus_step_speed_input.SetValue(config.get("Settings", "focus_step_speed"))
-        self.settings.focus_step_speed = int(config.get("Settings", "focus_step_speed"))
-        #self.focus_step_period_input.SetValue(config.get("Settings", "focus_step_period"))
-        #self.settings.focus_step_period = float(config.get("Settings", "focus_step_period"))
-        #self.focus_step_pause_input.SetValue(config.get("Settings", "focus_step_pause"))
-        #self.settings.focus_step_pause = float(config.get("Settings", "focus_step_pause"))
-
-        self.settings.timer_interval = float(TIMER_INTERVAL_MS) / 1000.0
+        loaded = {}
+        try:
+            loaded = read_config_section(APP_CONFIG_FILE, "Settings")
+        except configparser.Error as e:
+            wx.MessageBox(f"Error loading settings: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
+
+        # Use defaults for the missing or empty settings
+        settings = {**DEFAULT_SETTINGS, **{k: v for k, v in loaded.items() if v != ""}}
+        # kept for the Settings tab input fields (see build_settings_tab)
+        self.loaded_settings = settings
+
+        self.settings = MCTRLSettings.from_dict({
+            "com_port": settings["com_port"],
+            "zoom_motor_id": settings["zoom_id"],
+            "focus_motor_id": settings["focuser_id"],
+            "focus_step_speed": settings["focus_step_speed"],
+            #"focus_step_period": settings["focus_step_period"],
+            #"focus_step_pause": settings["focus_step_pause"],
+            "timer_interval": float(TIMER_INTERVAL_MS) / 1000.0
+        })
 
     def save_window_position_and_size(self):
         # Save the current window position and size to the configuration file
         x, y = self.GetPosition()
         width, height = self.GetSize()
 
-        config = configparser.ConfigParser()
-        config["Window"] = {
+        window = {
             "x": str(x),
             "y": str(y),
             "width": str(width),
@@ -307,8 +373,7 @@ class MyFrame(wx.Frame):
         }
 
         try:
-            with open(WINDOW_CONFIG_FILE, "w") as configfile:
-                config.write(configfile)
+            write_config_section(WINDOW_CONFIG_FILE, "Window", window)
         except Exception as e:
             wx.MessageBox(f"Error saving window position and size: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
 
@@ -329,35 +394,76 @@ class MyFrame(wx.Frame):
     def on_timer(self, event):
         # Process the timer firing event here
         # This method will be called every 100 milliseconds (as set in TIMER_INTERVAL_MS)
-        # It returns a list of string representing MCTRL events (see mctrl.py for details)
-        ret = MCTRL.timer_tick()
-        for val in ret:
-            if val == "ZOOM_DONE":
-                self.set_zoom_current_values()
-            elif val == "FOCUS_DONE":
-                self.set_focus_current_values()
-            elif val == "FOCUS_MOVE":
-                if self.last_moving == None:
-                    self.last_moving = time.time()
-                elif time.time() - self.last_moving > 1.0:
-                    self.last_moving = time.time()
-                    self.set_focus_current_values()
+        # while the timer is running
+        # Send the zoom level the slider was last dragged to
+        if self._pending_zoom is not None:
+            zoom_level = self._pending_zoom
+            self._pending_zoom = None
+            self.on_zoom_change(zoom_level)
+
+        # MCTRL.timer_tick() returns a list of string representing MCTRL events (see mctrl.py for details)
+        # Each UI area is updated at most once per tick whatever the number of events
+        events = set(MCTRL.timer_tick())
+        if "ZOOM_DONE" in events:
+            self.set_zoom_current_values()
+        if "FOCUS_DONE" in events:
+            self.set_focus_current_values()
+        elif "FOCUS_MOVING" in events and _now() - self.last_moving > 1.0:
+            self.last_moving = _now()
+            self.set_focus_current_values()
+
+        # Nothing left to do, stop ticking until the next zoom or focus command
+        if self._pending_zoom is None and not MCTRL.is_busy():
+            self.timer.Stop()
+
+    # Start the timer (if not running yet) to drive the motor moves
+    def start_timer(self):
+        if not self.timer.IsRunning():
+            self.timer.Start(TIMER_INTERVAL_MS)  # Set the timer firing rate in milliseconds
+
+    def on_page_changed(self, event, notebook):
+        self.build_tab_page(notebook, event.GetSelection())
+        event.Skip()
+
+    # Create the widgets of the notebook page if not done yet
+    def build_tab_page(self, notebook, index):
+        if index < 0:
+            return
+        tab_name = notebook.GetPageText(index)
+        if self._built.get(tab_name, True):
+            return
+        self._built[tab_name] = True
+        tab = notebook.GetPage(index)
+        if tab_name == "Focus":
+            self.build_focus_tab(tab)
+            self.set_focus_current_values()
+        else:
+            self.build_settings_tab(tab)
+        tab.Layout()
+        # Grow the window if the new tab content does not fit
+        tab.InvalidateBestSize()
+        best = self.panel.GetBestSize()
+        width, height = self.GetClientSize()
+        self.SetClientSize((max(width, best.width), max(height, best.height)))
 
     def remove_tab(self, notebook, tab_name):
-        # Find the tab page index by comparing the text, then remove the page
-        for ii in range(notebook.GetPageCount()):
-            if notebook.GetPageText(ii) == tab_name:
-                # Hide the content of the tab
-                notebook.RemovePage(ii)
-                return True
-        return False
+        # Look up the tab page index, remove the page and shift the indices of the pages after it
+        idx = self._tabs.pop(tab_name, None)
+        if idx is None:
+            return False
+        # Hide the content of the tab
+        notebook.RemovePage(idx)
+        for name, ii in self._tabs.items():
+            if ii > idx:
+                self._tabs[name] = ii - 1
+        return True
 
     # ========= Zoom handlers =========
 
     def get_zoom_current_level(self):
         val = None
         try:
-            val = ZOOM_MIN_VAL + int(round(MCTRL.get_zoom_current_level() * float(ZOOM_MAX_VAL - ZOOM_MIN_VAL)))
+            val = ZOOM_MIN_VAL + int(round(MCTRL.get_zoom_current_level() * _ZOOM_SPAN))
         except Exception as e:
             print(f"Error getting zoom position: {e}")
             pass
@@ -367,13 +473,17 @@ class MyFrame(wx.Frame):
 
     def set_zoom_current_values(self):
         # do nothing if not enabled
-        if not MCTRL.is_zoom_enabled():
+        if not self._zoom_en:
             return False
 
         # Set the initial slider position and "Current Zoom Level" value
         initial_zoom_level = self.get_zoom_current_level()
-        self.slider.SetValue(initial_zoom_level)
-        self.current_zoom_value.SetValue(str(initial_zoom_level))
+        if self.slider.GetValue() != initial_zoom_level:
+            self.slider.SetValue(initial_zoom_level)
+        zoom_str = str(initial_zoom_level)
+        if zoom_str != self._last_zoom_str:
+            self.current_zoom_value.SetValue(zoom_str)
+            self._last_zoom_str = zoom_str
 
         return True
 
@@ -381,22 +491,24 @@ class MyFrame(wx.Frame):
         # Get the slider value and set it as the "Target Zoom Level" value
         slider_value = self.slider.GetValue()
         self.target_zoom_input.SetValue(str(slider_value))
-        self.on_zoom_change(slider_value)
+        # Coalesce the drag events, the timer sends the last value
+        self._pending_zoom = slider_value
+        self.start_timer()
 
     def on_zoom_target_enter(self, event):
         # Call the on_zoom_change subroutine with the value entered in the "Target Zoom Level" field
-        target_zoom_value = self.target_zoom_input.GetValue()
-        if target_zoom_value.isdigit():  # Check if the entered value is a valid integer
-            self.on_zoom_change(int(target_zoom_value))
+        try:
+            target_zoom_value = int(self.target_zoom_input.GetValue())
+        except ValueError:  # Not a valid integer
+            return
+        self.on_zoom_change(target_zoom_value)
 
     def on_zoom_change(self, zoom_level):
         # Handle the event when the "Target Zoom Level" value is entered or the slider changes
-        if zoom_level > ZOOM_MAX_VAL:
-            zoom_level = ZOOM_MAX_VAL
-        if zoom_level < ZOOM_MIN_VAL:
-            zoom_level = ZOOM_MIN_VAL
-        val = float(zoom_level - ZOOM_MIN_VAL) / float(ZOOM_MAX_VAL - ZOOM_MIN_VAL)
+        zoom_level = max(ZOOM_MIN_VAL, min(ZOOM_MAX_VAL, zoom_level))
+        val = (zoom_level - ZOOM_MIN_VAL) * _ZOOM_SPAN_INV
         MCTRL.set_zoom_current_level(val)
+        self.start_timer()
 
     # ========= Focus handlers =========
 
@@ -417,15 +529,24 @@ class MyFrame(wx.Frame):
     # Update the UI with the focuser position and angle
     def set_focus_current_values(self):
         # do nothing if not enabled
-        if not MCTRL.is_focus_enabled():
+        if not self._focus_en:
             return False
+        # nothing to update until the tab is shown
+        if not self._built["Focus"]:
+            return True
 
         # Get the current steps and angle values
         current_steps = self.get_focus_current_steps()
         current_angle = self.get_focus_current_angle()
         # Update the "Current Steps" and "Current Motor Angle" fields
-        self.current_steps_value.SetValue(str(current_steps))
-        self.current_angle_value.SetValue(str(current_angle))
+        steps_str = str(current_steps)
+        if steps_str != self._last_steps_str:
+            self.current_steps_value.SetValue(steps_str)
+            self._last_steps_str = steps_str
+        angle_str = str(current_angle)
+        if angle_str != self._last_angle_str:
+            self.current_angle_value.SetValue(angle_str)
+            self._last_angle_str = angle_str
 
         return True
 
@@ -433,12 +554,14 @@ class MyFrame(wx.Frame):
     def on_focus_reset_steps(self, event):
         MCTRL.clear_focus_current_steps()
         self.current_steps_value.SetValue('0')
+        self._last_steps_str = '0'
 
     # Move the focuser up or down to the requested number of "steps"
-    def on_focus_button(self, event, value):
+    def on_focus_button(self, event):
         # Handle the event when an "Up:" or "Down:" button is clicked
-        # The 'value' parameter will be the positive or negative integer passed by the button
-        MCTRL.move_focus(value)
+        # The button's 'step_value' is the positive or negative number of steps to make
+        MCTRL.move_focus(event.GetEventObject().step_value)
+        self.start_timer()
 
 if __name__ == "__main__":
     while True: